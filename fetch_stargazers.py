@@ -9,10 +9,17 @@ Target repos: Amplitude JS, Mixpanel JS, Segment Analytics.js
 """
 
 import os
+import re
 import sys
 import json
 import time
+import atexit
+import shelve
+import threading
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from collections import defaultdict
 
@@ -28,8 +35,75 @@ REPOS = [
     "segmentio/analytics.js",
 ]
 
-# Rate limiting
-REQUEST_DELAY = 0.5  # seconds between requests
+# Rate limiting: a token bucket paced to GitHub's hourly quota, so requests
+# only wait when they would otherwise exceed it. Every attempt (including
+# retries and 304 revalidations) takes a token: 304s are only exempt from the
+# rate limit for authenticated requests, which never go through the cache.
+REQUESTS_PER_HOUR = 5000 if GITHUB_TOKEN else 60
+RATE_LIMIT_BURST = 100  # requests allowed back-to-back (capped at the hourly quota)
+ENRICH_CONCURRENCY = 32  # users enriched in parallel
+REQUEST_TIMEOUT = (5, 30)  # (connect, read) seconds
+MAX_RETRIES = 3  # retries for rate limits and transient 5xx errors
+MAX_RATE_LIMIT_WAIT = 15 * 60  # cap on a single rate limit sleep, in seconds
+
+# On-disk cache of GitHub responses, revalidated with ETags once stale.
+# A 304 saves the response body but still counts against the rate limit:
+# GitHub only exempts 304s on authenticated requests, which use GraphQL
+# instead of this cache.
+CACHE_PATH = os.path.join(os.path.dirname(__file__), "gh_cache")
+USER_CACHE_TTL = 60 * 60  # seconds before a cached profile is revalidated
+ORGS_CACHE_TTL = 30 * 60  # seconds before a cached org list is revalidated
+CACHE_MAX_AGE = 3 * 24 * 60 * 60  # entries untouched this long are pruned on open
+
+# Scoring
+ORG_SCORE = 2  # points for belonging to at least one public org
+# Over REST, orgs cost a second request per user, so they're only looked up
+# for users who already score at least this much on their other signals.
+# This trades requests for accuracy: a skipped user who does belong to orgs
+# loses up to ORG_SCORE points (which can rank them below score-1 leads) and
+# gets an empty orgs list in the output. The GraphQL path doesn't apply this,
+# since orgs arrive in the same query as the profile at no extra cost.
+ORGS_LOOKUP_MIN_SCORE = 1
+
+# GraphQL lets one request cover many users (and their orgs) via aliases,
+# but it requires a token; unauthenticated runs fall back to REST.
+GRAPHQL_URL = "https://api.github.com/graphql"
+GRAPHQL_BATCH_SIZE = 100  # users per query
+
+_STARGAZERS_QUERY = """
+query($owner: String!, $name: String!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    stargazers(first: 100, after: $after, orderBy: {field: STARRED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      edges { starredAt node { login url } }
+    }
+  }
+}
+"""
+
+# Aliases given to each user(login:) field in a batched query
+_USER_ALIAS_RE = re.compile(r"u\d+")
+
+_USER_FRAGMENT = """
+fragment UserFields on User {
+  name
+  company
+  email
+  bio
+  location
+  websiteUrl
+  twitterUsername
+  repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+  followers { totalCount }
+  organizations(first: 100) { nodes { login } }
+}
+"""
+
+# Legal-entity suffixes stripped from company names ("Acme, Inc." -> "Acme")
+_SUFFIX_RE = re.compile(r"(?:,\s*|\s+)(?:Inc|LLC|Ltd)\.?$", re.IGNORECASE)
+
+# Page number of the rel="last" entry in a REST Link header
+_LAST_PAGE_RE = re.compile(r'page=(\d+)>;\s*rel="last"')
 
 
 def get_headers(include_starred_at: bool = False):
@@ -49,17 +123,271 @@ def get_headers(include_starred_at: bool = False):
     return headers
 
 
-def fetch_stargazers(repo: str, max_stargazers: int = 200) -> list[dict]:
+def _build_session() -> requests.Session:
+    """Create a pooled, keep-alive session for GitHub API requests."""
+    session = requests.Session()
+    session.headers.update(get_headers())
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=ENRICH_CONCURRENCY,
+        # No adapter-level retries: github_request is the single retry layer
+        # for status codes, timeouts and connection errors, so every attempt
+        # goes through the rate limiter.
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+
+def get_session() -> requests.Session:
+    """Return the shared GitHub API session."""
+    return _SESSION
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `burst` requests, refilled at `rate` per second."""
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Take a token, sleeping only if the bucket is empty."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Going negative reserves a future token, so waiting threads queue fairly
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        
+        if wait:
+            time.sleep(wait)
+
+
+_RATE_LIMITER = RateLimiter(REQUESTS_PER_HOUR / 3600, min(RATE_LIMIT_BURST, REQUESTS_PER_HOUR))
+
+
+def _is_rate_limited(response: requests.Response) -> bool:
+    """Whether GitHub rejected this request for exceeding a rate limit."""
+    if response.status_code == 429:
+        return True
+    return response.status_code == 403 and (
+        "Retry-After" in response.headers
+        or response.headers.get("X-RateLimit-Remaining") == "0"
+    )
+
+
+def _wait_for_rate_limit(response: requests.Response):
+    """Sleep until the rate limit window in the response headers resets."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        # Secondary rate limits say how long to back off directly
+        wait = int(retry_after)
+    elif "X-RateLimit-Reset" in response.headers:
+        # Primary rate limits give the epoch second the window resets
+        wait = max(0, int(response.headers["X-RateLimit-Reset"]) - time.time()) + 1
+    else:
+        wait = 60
+    
+    wait = min(wait, MAX_RATE_LIMIT_WAIT)
+    print(f"    ⚠️  Rate limited. Waiting {wait:.0f} seconds...")
+    time.sleep(wait)
+
+
+def github_request(method: str, url: str, **kwargs) -> requests.Response | None:
     """
-    Fetch recent stargazers for a repo.
+    Send a request through the shared session, waiting out rate limits and
+    retrying transient 5xx errors, timeouts and connection errors with
+    exponential backoff.
+    
+    Returns the last response, which may still be an error, or None if no
+    response was received at all.
+    """
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    
+    for attempt in range(MAX_RETRIES + 1):
+        _RATE_LIMITER.acquire()
+        try:
+            response = _SESSION.request(method, url, **kwargs)
+        except (requests.Timeout, requests.ConnectionError) as e:
+            if attempt == MAX_RETRIES:
+                print(f"    ❌ Request to {url} failed: {e}")
+                return None
+            time.sleep(min(2 ** attempt, 60))
+            continue
+        
+        if attempt == MAX_RETRIES:
+            break
+        
+        if _is_rate_limited(response):
+            _wait_for_rate_limit(response)
+        elif response.status_code >= 500:
+            time.sleep(min(2 ** attempt, 60))
+        else:
+            break
+    
+    # Don't let the next request fail if this one used the last of the quota
+    if response.headers.get("X-RateLimit-Remaining") == "0" and not _is_rate_limited(response):
+        _wait_for_rate_limit(response)
+    
+    return response
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache() -> shelve.Shelf:
+    """Open the response cache on first use, pruning entries past CACHE_MAX_AGE."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = shelve.open(CACHE_PATH)
+            atexit.register(_cache.close)
+            cutoff = time.time() - CACHE_MAX_AGE
+            for url in [url for url, entry in _cache.items() if entry["fetched_at"] < cutoff]:
+                del _cache[url]
+        return _cache
+
+
+def cached_get_json(url: str, ttl: int):
+    """
+    GET a GitHub API URL, reusing the cached body when possible.
+    
+    Fresh entries (younger than ttl) are returned without a request. Stale
+    entries are revalidated with If-None-Match, and a 304 reuses the body.
+    
+    Returns the decoded JSON, or None if the request failed.
+    """
+    cache = _get_cache()
+    with _cache_lock:
+        entry = cache.get(url)
+    
+    if entry and time.time() - entry["fetched_at"] < ttl:
+        return entry["data"]
+    
+    headers = {"If-None-Match": entry["etag"]} if entry and entry["etag"] else {}
+    response = github_request("GET", url, headers=headers)
+    
+    if response is None:
+        return None
+    if response.status_code == 304:
+        data = entry["data"]
+    elif response.status_code == 200:
+        data = response.json()
+    else:
+        return None
+    
+    with _cache_lock:
+        cache[url] = {
+            "etag": response.headers.get("ETag"),
+            "data": data,
+            "fetched_at": time.time(),
+        }
+    return data
+
+
+def fetch_stargazers(repo: str, since: datetime, max_stargazers: int = 200) -> list[dict]:
+    """
+    Fetch stargazers who starred a repo since the given time, newest first.
+    
+    Pages through the GraphQL stargazers connection ordered by starredAt,
+    stopping at the first star older than `since`.
+    
+    Returns list of {username, repo, user_url, starred_at} dicts.
+    """
+    if not GITHUB_TOKEN:
+        return fetch_stargazers_rest(repo, since, max_stargazers)
+    
+    stargazers = []
+    owner, name = repo.split("/")
+    cursor = None
+    
+    print(f"  Fetching stargazers for {repo}...")
+    
+    while len(stargazers) < max_stargazers:
+        data = graphql_query(_STARGAZERS_QUERY, {"owner": owner, "name": name, "after": cursor})
+        repository = data.get("repository")
+        if not repository:
+            print(f"  ❌ Error fetching {repo}")
+            break
+        
+        connection = repository["stargazers"]
+        reached_since = False
+        for edge in connection["edges"]:
+            starred_at = datetime.fromisoformat(edge["starredAt"].replace("Z", "+00:00"))
+            if starred_at < since:
+                reached_since = True
+                break
+            
+            stargazers.append({
+                "username": edge["node"]["login"],
+                "repo": repo,
+                "user_url": edge["node"]["url"],
+                "starred_at": edge["starredAt"],
+            })
+        
+        if reached_since or not connection["pageInfo"]["hasNextPage"]:
+            break
+        cursor = connection["pageInfo"]["endCursor"]
+    
+    recent = stargazers[:max_stargazers]
+    print(f"  ✓ Found {len(recent)} stargazers")
+    return recent
+
+
+def _parse_rest_stargazers(data: list, repo: str, since: datetime) -> list[dict]:
+    """Extract stargazers who starred since the given time from a REST page."""
+    stargazers = []
+    for user in data:
+        if isinstance(user, dict):
+            if "user" in user:
+                username = user["user"]["login"]
+                user_url = user["user"]["html_url"]
+                starred_at = user.get("starred_at")
+            else:
+                # Plain format (star+json not honoured): no date to filter on
+                username = user.get("login")
+                user_url = user.get("html_url")
+                starred_at = None
+            
+            if starred_at and datetime.fromisoformat(starred_at.replace("Z", "+00:00")) < since:
+                continue
+            
+            if username:
+                stargazers.append({
+                    "username": username,
+                    "repo": repo,
+                    "user_url": user_url,
+                    "starred_at": starred_at,
+                })
+    return stargazers
+
+
+def fetch_stargazers_rest(repo: str, since: datetime, max_stargazers: int = 200) -> list[dict]:
+    """
+    Fetch stargazers who starred a repo since the given time over REST (used
+    without a token).
+    
+    REST pages are ordered oldest first and can't be queried by date, so this
+    takes the last accessible pages and filters them on starred_at (returned
+    via the star+json media type).
     
     GitHub API limitation: Can only access first ~400 pages (40,000 stargazers).
     For very popular repos, we fetch from the highest accessible pages.
     
-    Returns list of {username, repo} dicts.
+    Returns list of {username, repo, user_url, starred_at} dicts.
     """
     stargazers = []
     per_page = 100
+    star_headers = get_headers(include_starred_at=True)
     
     print(f"  Fetching stargazers for {repo}...")
     
@@ -68,8 +396,10 @@ def fetch_stargazers(repo: str, max_stargazers: int = 200) -> list[dict]:
     
     # First, get the total count by checking headers
     url = f"https://api.github.com/repos/{repo}/stargazers"
-    response = requests.get(url, headers=get_headers(), params={"per_page": 1, "page": 1})
+    response = github_request("GET", url, params={"per_page": 1, "page": 1})
     
+    if response is None:
+        return []
     if response.status_code != 200:
         print(f"  ❌ Error fetching {repo}: {response.status_code} - {response.text}")
         return []
@@ -79,8 +409,7 @@ def fetch_stargazers(repo: str, max_stargazers: int = 200) -> list[dict]:
     last_page = 1
     
     if 'rel="last"' in link_header:
-        import re
-        match = re.search(r'page=(\d+)>; rel="last"', link_header)
+        match = _LAST_PAGE_RE.search(link_header)
         if match:
             last_page = int(match.group(1))
     
@@ -99,20 +428,12 @@ def fetch_stargazers(repo: str, max_stargazers: int = 200) -> list[dict]:
     print(f"    Fetching pages {start_page} to {accessible_last_page}...")
     
     for page in range(start_page, accessible_last_page + 1):
-        response = requests.get(
-            url, 
-            headers=get_headers(), 
-            params={"per_page": per_page, "page": page}
+        response = github_request(
+            "GET", url, headers=star_headers, params={"per_page": per_page, "page": page}
         )
         
-        if response.status_code == 403:
-            print(f"    ⚠️  Rate limited. Waiting 60 seconds...")
-            time.sleep(60)
-            response = requests.get(
-                url, 
-                headers=get_headers(), 
-                params={"per_page": per_page, "page": page}
-            )
+        if response is None:
+            continue
         
         if response.status_code == 422:
             print(f"    ⚠️  Page {page} not accessible, trying lower page...")
@@ -123,54 +444,7 @@ def fetch_stargazers(repo: str, max_stargazers: int = 200) -> list[dict]:
             print(f"    ❌ Error fetching page {page}: {response.status_code}")
             continue
         
-        data = response.json()
-        
-        for user in data:
-            if isinstance(user, dict):
-                if "user" in user:
-                    username = user["user"]["login"]
-                    user_url = user["user"]["html_url"]
-                else:
-                    username = user.get("login")
-                    user_url = user.get("html_url")
-                
-                if username:
-                    stargazers.append({
-                        "username": username,
-                        "repo": repo,
-                        "user_url": user_url,
-                    })
-        
-        time.sleep(REQUEST_DELAY)
-    
-    # If we got nothing from high pages, try the first few pages instead
-    if len(stargazers) == 0 and accessible_last_page > 5:
-        print(f"    Trying first pages instead...")
-        for page in range(1, 6):
-            response = requests.get(
-                url, 
-                headers=get_headers(), 
-                params={"per_page": per_page, "page": page}
-            )
-            
-            if response.status_code != 200:
-                continue
-            
-            data = response.json()
-            
-            for user in data:
-                if isinstance(user, dict):
-                    username = user.get("login")
-                    user_url = user.get("html_url")
-                    
-                    if username:
-                        stargazers.append({
-                            "username": username,
-                            "repo": repo,
-                            "user_url": user_url,
-                        })
-            
-            time.sleep(REQUEST_DELAY)
+        stargazers.extend(_parse_rest_stargazers(response.json(), repo, since))
     
     recent = stargazers[-max_stargazers:] if len(stargazers) > max_stargazers else stargazers
     print(f"  ✓ Found {len(recent)} stargazers")
@@ -180,17 +454,11 @@ def fetch_stargazers(repo: str, max_stargazers: int = 200) -> list[dict]:
 def fetch_user_details(username: str) -> dict:
     """Fetch detailed user info including company and email."""
     url = f"https://api.github.com/users/{username}"
-    response = requests.get(url, headers=get_headers())
-    
-    if response.status_code == 403:
-        print(f"    ⚠️  Rate limited on user {username}, waiting...")
-        time.sleep(60)
-        response = requests.get(url, headers=get_headers())
+    data = cached_get_json(url, USER_CACHE_TTL)
     
-    if response.status_code != 200:
+    if data is None:
         return {}
     
-    data = response.json()
     return {
         "name": data.get("name"),
         "company": data.get("company"),
@@ -207,12 +475,103 @@ def fetch_user_details(username: str) -> dict:
 def fetch_user_orgs(username: str) -> list[str]:
     """Fetch public organizations for a user."""
     url = f"https://api.github.com/users/{username}/orgs"
-    response = requests.get(url, headers=get_headers())
+    data = cached_get_json(url, ORGS_CACHE_TTL)
     
-    if response.status_code != 200:
+    if data is None:
         return []
     
-    return [org["login"] for org in response.json()]
+    return [org["login"] for org in data]
+
+
+def graphql_query(query: str, variables: dict = None) -> dict:
+    """
+    Run a GitHub GraphQL query and return its data (partial on errors).
+    
+    GraphQL reports rate limiting as a RATE_LIMITED error on a 200 response,
+    so those are waited out and retried like a rate-limited REST response.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        response = github_request(
+            "POST",
+            GRAPHQL_URL,
+            json={"query": query, "variables": variables or {}},
+        )
+        
+        if response is None:
+            return {}
+        if response.status_code != 200:
+            print(f"    ❌ GraphQL error: {response.status_code} - {response.text}")
+            return {}
+        
+        body = response.json()
+        
+        # Unknown logins come back as null on their own alias plus a NOT_FOUND
+        # error; those are expected and shouldn't be reported. Anything else
+        # (rate limits, query complexity, token scopes) is.
+        errors = [
+            error for error in body.get("errors") or []
+            if not (
+                error.get("type") == "NOT_FOUND"
+                and len(error.get("path") or []) == 1
+                and _USER_ALIAS_RE.fullmatch(str(error["path"][0]))
+            )
+        ]
+        rate_limited = any(error.get("type") == "RATE_LIMITED" for error in errors)
+        if not rate_limited or attempt == MAX_RETRIES:
+            break
+        _wait_for_rate_limit(response)
+    
+    for error in errors:
+        print(f"    ❌ GraphQL error: {error.get('type', 'ERROR')} - {error.get('message')}")
+    
+    if rate_limited:
+        return {}
+    return body.get("data") or {}
+
+
+def fetch_users_batch(usernames: list[str]) -> dict[str, tuple[dict, list[str]]]:
+    """
+    Fetch details and orgs for up to GRAPHQL_BATCH_SIZE users in one request.
+    
+    Returns {username: (details, orgs)}, with the same details shape as
+    fetch_user_details. Unknown users map to ({}, []); users missing from
+    the response entirely (e.g. the query failed) are left out.
+    """
+    aliases = "\n".join(
+        f"  u{i}: user(login: {json.dumps(username)}) {{ ...UserFields }}"
+        for i, username in enumerate(usernames)
+    )
+    data = graphql_query(f"query {{\n{aliases}\n}}\n{_USER_FRAGMENT}")
+    
+    results = {}
+    for i, username in enumerate(usernames):
+        if f"u{i}" not in data:
+            continue
+        
+        node = data[f"u{i}"]
+        if not node:
+            results[username] = ({}, [])
+            continue
+        
+        details = {
+            "name": node.get("name"),
+            "company": node.get("company"),
+            "email": node.get("email") or None,
+            "bio": node.get("bio"),
+            "location": node.get("location"),
+            "blog": node.get("websiteUrl"),
+            "twitter": node.get("twitterUsername"),
+            "public_repos": node["repositories"]["totalCount"],
+            "followers": node["followers"]["totalCount"],
+        }
+        # Orgs the token can't read (e.g. SAML-protected) come back as null nodes
+        orgs = [org["login"] for org in node["organizations"]["nodes"] if org]
+        results[username] = (details, orgs)
+    
+    if len(results) < len(usernames):
+        print(f"    ⚠️  Skipping {len(usernames) - len(results)} users missing from GraphQL response")
+    
+    return results
 
 
 def clean_company_name(company: str) -> str:
@@ -221,99 +580,135 @@ def clean_company_name(company: str) -> str:
         return ""
     
     # Remove common prefixes
-    company = company.strip()
-    if company.startswith("@"):
-        company = company[1:]
+    company = company.strip().removeprefix("@")
     
     # Remove common suffixes
-    for suffix in [", Inc.", ", Inc", " Inc.", " Inc", " LLC", " Ltd", " Ltd."]:
-        if company.endswith(suffix):
-            company = company[:-len(suffix)]
+    return _SUFFIX_RE.sub("", company).strip()
+
+
+def build_lead(star: dict, details: dict, orgs: list[str]) -> dict:
+    """Combine a stargazer with their profile details and orgs."""
+    company = clean_company_name(details.get("company", ""))
+    
+    return {
+        **star,
+        **details,
+        "company_clean": company,
+        "orgs": orgs,
+        "org_count": len(orgs),
+    }
+
+
+def enrich_user(star: dict) -> dict:
+    """Fetch details (and orgs, if worthwhile) for a single stargazer over REST."""
+    username = star["username"]
+    details = fetch_user_details(username)
+    lead = build_lead(star, details, [])
+    
+    if score_lead(lead) >= ORGS_LOOKUP_MIN_SCORE:
+        lead = build_lead(star, details, fetch_user_orgs(username))
     
-    return company.strip()
+    return lead
+
+
+def enrich_batch(stars: list[dict]) -> list[dict]:
+    """Fetch details and orgs for a batch of stargazers."""
+    # GraphQL needs a token; without one, fall back to two REST calls per user
+    if not GITHUB_TOKEN:
+        return [enrich_user(star) for star in stars]
+    
+    users = fetch_users_batch([star["username"] for star in stars])
+    return [
+        build_lead(star, *users[star["username"]])
+        for star in stars
+        if star["username"] in users
+    ]
 
 
 def enrich_stargazers(stargazers: list[dict]) -> list[dict]:
-    """Add user details and org info to stargazers."""
-    enriched = []
+    """Add user details and org info to stargazers, fetching users concurrently."""
     total = len(stargazers)
+    batch_size = GRAPHQL_BATCH_SIZE if GITHUB_TOKEN else 1
     
     print(f"\nEnriching {total} users...")
     
-    for i, star in enumerate(stargazers):
-        username = star["username"]
-        print(f"  [{i+1}/{total}] {username}", end="")
-        
-        # Get user details
-        details = fetch_user_details(username)
-        time.sleep(REQUEST_DELAY)
-        
-        # Get orgs
-        orgs = fetch_user_orgs(username)
-        time.sleep(REQUEST_DELAY)
-        
-        company = clean_company_name(details.get("company", ""))
-        
-        enriched.append({
-            **star,
-            **details,
-            "company_clean": company,
-            "orgs": orgs,
-            "org_count": len(orgs),
-        })
-        
-        print(f" → {company or '(no company)'}")
+    # Requests are I/O bound, so a thread pool overlaps the network round
+    # trips; ENRICH_CONCURRENCY bounds how many are in flight at once.
+    enriched = []
+    with ThreadPoolExecutor(max_workers=ENRICH_CONCURRENCY) as executor:
+        futures = [
+            executor.submit(enrich_batch, stargazers[start:start + batch_size])
+            for start in range(0, total, batch_size)
+        ]
+        for future in futures:
+            for lead in future.result():
+                enriched.append(lead)
+                print(f"  [{len(enriched)}/{total}] {lead['username']} → {lead['company_clean'] or '(no company)'}")
     
     return enriched
 
 
-def dedupe_and_score(leads: list[dict]) -> list[dict]:
+def dedupe_stargazers(stargazers: list[dict]) -> list[dict]:
     """
-    Deduplicate by username and add a basic score.
-    Higher score = more interesting lead.
+    Collapse stargazers to one entry per username before enrichment, so
+    users who starred several repos are only fetched once.
+    
+    Each entry keeps the first star's fields and lists every repo starred.
     """
-    # Dedupe - keep the one with most info, track all repos they starred
     by_username = {}
-    for lead in leads:
-        username = lead["username"]
-        if username not in by_username:
-            lead["repos_starred"] = [lead["repo"]]
-            by_username[username] = lead
-        else:
-            # Add this repo to their list
-            existing = by_username[username]
-            if lead["repo"] not in existing["repos_starred"]:
-                existing["repos_starred"].append(lead["repo"])
+    for star in stargazers:
+        # _repo_set mirrors repos_starred for O(1) membership checks
+        entry = by_username.setdefault(
+            star["username"], {**star, "_repo_set": set(), "repos_starred": []}
+        )
+        if star["repo"] not in entry["_repo_set"]:
+            entry["_repo_set"].add(star["repo"])
+            entry["repos_starred"].append(star["repo"])
     
-    # Score
+    for entry in by_username.values():
+        del entry["_repo_set"]
+    
+    return list(by_username.values())
+
+
+def score_lead(lead: dict) -> int:
+    """Score a single lead. Higher score = more interesting lead."""
+    score = 0
+    
+    # Has company = good signal
+    if lead.get("company_clean"):
+        score += 3
+    
+    # In orgs = likely professional
+    if lead.get("org_count", 0) > 0:
+        score += ORG_SCORE
+    
+    # Has email = easier to contact
+    if lead.get("email"):
+        score += 2
+    
+    # Multiple repos starred = high intent
+    repos_starred = lead.get("repos_starred", [])
+    score += (len(repos_starred) - 1) * 3
+    
+    # Some followers = established presence
+    followers = lead.get("followers", 0)
+    if followers > 100:
+        score += 2
+    elif followers > 10:
+        score += 1
+    
+    return score
+
+
+def score_leads(leads: list[dict]) -> list[dict]:
+    """
+    Add a basic score to each (already deduplicated) lead.
+    Higher score = more interesting lead.
+    """
     scored = []
-    for lead in by_username.values():
-        score = 0
-        
-        # Has company = good signal
-        if lead.get("company_clean"):
-            score += 3
-        
-        # In orgs = likely professional
-        if lead.get("org_count", 0) > 0:
-            score += 2
-        
-        # Has email = easier to contact
-        if lead.get("email"):
-            score += 2
-        
-        # Multiple repos starred = high intent
-        repos_starred = lead.get("repos_starred", [])
-        score += (len(repos_starred) - 1) * 3
-        
-        # Some followers = established presence
-        followers = lead.get("followers", 0)
-        if followers > 100:
-            score += 2
-        elif followers > 10:
-            score += 1
-        
-        lead["score"] = score
+    for lead in leads:
+        lead["score"] = score_lead(lead)
         scored.append(lead)
     
     # Sort by score descending
@@ -331,13 +726,16 @@ def send_to_clay(leads: list[dict]) -> bool:
     print(f"\nSending {len(leads)} leads to Clay...")
     
     # Clay webhooks typically expect individual records or a batch
-    # We'll send as a batch
+    # We'll send as a batch. This deliberately bypasses _SESSION, which
+    # carries the GitHub token in its default headers.
     payload = {"leads": leads, "fetched_at": datetime.now(timezone.utc).isoformat()}
+    body = orjson.dumps(payload, default=str)
     
     response = requests.post(
         CLAY_WEBHOOK_URL,
-        json=payload,
-        headers={"Content-Type": "application/json"}
+        data=body,
+        headers={"Content-Type": "application/json"},
+        timeout=REQUEST_TIMEOUT,
     )
     
     if response.status_code in (200, 201, 202):
@@ -351,8 +749,8 @@ def send_to_clay(leads: list[dict]) -> bool:
 def save_local(leads: list[dict], filename: str = "leads.json"):
     """Save leads to local JSON file."""
     output_path = os.path.join(os.path.dirname(__file__), filename)
-    with open(output_path, "w") as f:
-        json.dump(leads, f, indent=2, default=str)
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(leads, option=orjson.OPT_INDENT_2, default=str))
     print(f"✓ Saved {len(leads)} leads to {output_path}")
     return output_path
 
@@ -371,15 +769,19 @@ def main():
     
     # Configuration
     max_per_repo = 200  # Get up to 200 most recent stargazers per repo
-    print(f"\nFetching up to {max_per_repo} recent stargazers per repo")
+    print(f"\nFetching up to {max_per_repo} stargazers per repo from the last {LOOKBACK_DAYS} days")
     print(f"Repos: {', '.join(REPOS)}")
     
     # Fetch stargazers from all repos
+    since = datetime.now(timezone.utc) - timedelta(days=LOOKBACK_DAYS)
+    # Repos are independent, so fetch them concurrently
     all_stargazers = []
-    for repo in REPOS:
-        stargazers = fetch_stargazers(repo, max_stargazers=max_per_repo)
-        all_stargazers.extend(stargazers)
-        time.sleep(REQUEST_DELAY)
+    with ThreadPoolExecutor(max_workers=len(REPOS)) as executor:
+        for stargazers in executor.map(
+            lambda repo: fetch_stargazers(repo, since, max_stargazers=max_per_repo),
+            REPOS,
+        ):
+            all_stargazers.extend(stargazers)
     
     print(f"\nTotal stargazers found: {len(all_stargazers)}")
     
@@ -387,11 +789,15 @@ def main():
         print("No stargazers found in the time period. Exiting.")
         return
     
+    # Dedupe before enriching so each user is only fetched once
+    unique_stargazers = dedupe_stargazers(all_stargazers)
+    print(f"Unique users: {len(unique_stargazers)}")
+    
     # Enrich with user details
-    enriched = enrich_stargazers(all_stargazers)
+    enriched = enrich_stargazers(unique_stargazers)
     
-    # Dedupe and score
-    leads = dedupe_and_score(enriched)
+    # Score
+    leads = score_leads(enriched)
     
     print(f"\nFinal lead count: {len(leads)}")
     